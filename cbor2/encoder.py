@@ -1,7 +1,6 @@
 import re
 import struct
 from collections import OrderedDict, defaultdict
-from contextlib import contextmanager
 from functools import wraps
 from datetime import datetime, date, time
 from io import BytesIO
@@ -52,9 +51,13 @@ def shareable_encoder(func):
     return wrapper
 
 
+# Precomputed initial bytes, used for all headers whose argument fits in the initial byte itself
+_initial_bytes = tuple(struct.pack('>B', i) for i in range(256))
+
+
 def encode_length(major_tag, length):
-    if length < 24:
-        return struct.pack('>B', major_tag | length)
+    if 0 <= length < 24:
+        return _initial_bytes[major_tag | length]
     elif length < 256:
         return struct.pack('>BB', major_tag | 24, length)
     elif length < 65536:
@@ -98,16 +101,18 @@ def encode_string(encoder, value):
 @shareable_encoder
 def encode_array(encoder, value):
     encoder.write(encode_length(0x80, len(value)))
+    encode = encoder.encode
     for item in value:
-        encoder.encode(item)
+        encode(item)
 
 
 @shareable_encoder
 def encode_map(encoder, value):
     encoder.write(encode_length(0xa0, len(value)))
+    encode = encoder.encode
     for key, val in iteritems(value):
-        encoder.encode(key)
-        encoder.encode(val)
+        encode(key)
+        encode(val)
 
 
 def encode_sortable_key(encoder, value):
@@ -121,9 +126,11 @@ def encode_canonical_map(encoder, value):
     """Reorder keys according to Canonical CBOR specification"""
     keyed_keys = ((encode_sortable_key(encoder, key), key) for key in value.keys())
     encoder.write(encode_length(0xa0, len(value)))
+    write = encoder.write
+    encode = encoder.encode
     for sortkey, realkey in sorted(keyed_keys):
-        encoder.write(sortkey[1])
-        encoder.encode(value[realkey])
+        write(sortkey[1])
+        encode(value[realkey])
 
 
 def encode_semantic(encoder, value):
@@ -210,7 +217,7 @@ def encode_canonical_set(encoder, value):
 
 def encode_simple_value(encoder, value):
     if value.value < 20:
-        encoder.write(struct.pack('>B', 0xe0 | value.value))
+        encoder.write(_initial_bytes[0xe0 | value.value])
     else:
         encoder.write(struct.pack('>BB', 0xf8, value.value))
 
@@ -308,6 +315,20 @@ canonical_encoders = OrderedDict([
 ])
 
 
+class _ValueSharingDisabler(object):
+    __slots__ = ('encoder', 'old_value_sharing')
+
+    def __init__(self, encoder):
+        self.encoder = encoder
+
+    def __enter__(self):
+        self.old_value_sharing = self.encoder.value_sharing
+        self.encoder.value_sharing = False
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.encoder.value_sharing = self.old_value_sharing
+
+
 class CBOREncoder(object):
     """
     Serializes objects to a byte stream using Concise Binary Object Representation.
@@ -359,13 +380,9 @@ class CBOREncoder(object):
 
         return None
 
-    @contextmanager
     def disable_value_sharing(self):
         """Disable value sharing in the encoder for the duration of the context block."""
-        old_value_sharing = self.value_sharing
-        self.value_sharing = False
-        yield
-        self.value_sharing = old_value_sharing
+        return _ValueSharingDisabler(self)
 
     def write(self, data):
         """
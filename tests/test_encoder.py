@@ -1,4 +1,5 @@
 import re
+import struct
 import sys
 from binascii import unhexlify
 from collections import OrderedDict
@@ -6,12 +7,13 @@ from datetime import datetime, timedelta, date
 from decimal import Decimal
 from email.mime.text import MIMEText
 from fractions import Fraction
+from io import BytesIO
 from uuid import UUID
 
 import pytest
 
 from cbor2.compat import timezone, pack_float16
-from cbor2.encoder import dumps, CBOREncodeError, dump, shareable_encoder
+from cbor2.encoder import dumps, CBOREncodeError, dump, shareable_encoder, CBOREncoder
 from cbor2.types import CBORTag, undefined, CBORSimpleValue, FrozenDict
 
 
@@ -174,6 +176,10 @@ def test_custom_tag():
     assert dumps(CBORTag(6000, u'Hello')) == expected
 
 
+def test_negative_tag():
+    pytest.raises(struct.error, dumps, CBORTag(-1, 1))
+
+
 def test_cyclic_array():
     """Test that an array that contains itself can be serialized with value sharing enabled."""
     expected = unhexlify('d81c81d81c81d81d00')
@@ -344,3 +350,13 @@ def test_float16_encoder(value, expected):
         assert pack_float16(value) == expected
     else:
         assert not pack_float16(value)
+
+
+def test_disable_value_sharing():
+    encoder = CBOREncoder(BytesIO(), value_sharing=True)
+    with pytest.raises(ZeroDivisionError):
+        with encoder.disable_value_sharing():
+            assert not encoder.value_sharing
+            1 / 0
+
+    assert encoder.value_sharing